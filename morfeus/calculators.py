@@ -2,21 +2,60 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
 import typing
+from typing import Any
 
 import numpy as np
 from scipy.spatial.distance import cdist
 
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from morfeus.d3_data import c6_reference_data, r2_r4
 from morfeus.data import ANGSTROM_TO_BOHR
 from morfeus.geometry import Atom
-from morfeus.typing import Array1DFloat, Array1DInt, Array2DFloat, ArrayLike2D
+from morfeus.typing import (
+    Array1DFloat,
+    Array1DInt,
+    Array2DFloat,
+    ArrayLike1D,
+    ArrayLike2D,
+)
 from morfeus.utils import convert_elements, get_radii, Import, requires_dependency
 
 if typing.TYPE_CHECKING:
     from dftd4.interface import DispersionModel
 
+# Parameters for the D3 coordination numbers and C6 interpolation
+D3_K_1 = 16
+D3_K_2 = 4 / 3
+D3_K_3 = 4
+
+# Smallest system for which the Numba kernels are used. Below this, the NumPy code is
+# as fast and avoids the compilation overhead.
+D3_NUMBA_MIN_ATOMS = 1000
+
+# D3 C6 reference data of all elements packed into one array. The rows of element i
+# are found between D3_REFERENCE_OFFSETS[i] and D3_REFERENCE_OFFSETS[i + 1].
+D3_REFERENCE_DATA: Array2DFloat = np.vstack(
+    [c6_reference_data[element] for element in sorted(c6_reference_data)]
+)
+D3_REFERENCE_OFFSETS: Array1DInt = np.cumsum(
+    [0]
+    + [
+        len(c6_reference_data.get(element, []))
+        for element in range(max(c6_reference_data) + 1)
+    ]
+)
+
 
 @requires_dependency(
     [
@@ -82,6 +121,28 @@ class D4Grimme:
         self.c_n_coefficients = c_n_coefficients
         self.coordination_numbers = coordination_numbers
 
+    @classmethod
+    def from_batch(
+        cls,
+        molecules: Iterable[tuple[Iterable[int] | Iterable[str], ArrayLike2D]],
+        n_processes: int | None = None,
+        **kwargs: Any,
+    ) -> list[D4Grimme]:
+        """Calculate multiple molecules in parallel processes.
+
+        Workers are spawned, so scripts must call this under
+        ``if __name__ == "__main__":``.
+
+        Args:
+            molecules: Pairs of elements and coordinates (Å)
+            n_processes: Number of processes. Defaults to the number of CPUs.
+            **kwargs: Keyword arguments passed on to each calculation
+
+        Returns:
+            calculators: Calculator objects in the same order as molecules
+        """
+        return _compute_batch(cls, molecules, n_processes, **kwargs)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({len(self.polarizabilities)!r} atoms)"
 
@@ -103,7 +164,9 @@ class D3Calculator:
 
     c_n_coefficients: dict[int, Array1DFloat]
     coordination_numbers: Array1DFloat
-    _atoms: list[Atom]
+    _coordinates: Array2DFloat
+    _elements: Array1DInt
+    _radii: Array1DFloat
 
     def __init__(
         self,
@@ -112,106 +175,82 @@ class D3Calculator:
         order: int = 8,
     ) -> None:
         # Convert elements to atomic numbers
-        elements = convert_elements(elements, output="numbers")
-        coordinates: Array2DFloat = np.array(coordinates)
+        elements: Array1DInt = np.array(convert_elements(elements, output="numbers"))
+        coordinates: Array2DFloat = np.array(coordinates, dtype=float).reshape(-1, 3)
 
         # Load the covalent radii
-        radii = get_radii(elements, radii_type="pyykko")
+        radii: Array1DFloat = np.array(get_radii(elements, radii_type="pyykko"))
+
+        # Calculate the coordination numbers according to Grimme's recipe.
+        coordination_numbers = get_d3_coordination_numbers(coordinates, radii)
+
+        # Calculate the C_N coefficients
+        c_6 = get_d3_c6_coefficients(elements, coordination_numbers)
+        c_n_coefficients: dict[int, Array1DFloat] = {}
+        for i in range(6, order + 1, 2):
+            if i == 6:
+                c_n_coefficients[i] = c_6
+            elif i == 8:
+                r2_r4_values = np.array([r2_r4[element] for element in elements])
+                c_n_coefficients[i] = 3 * c_6 * r2_r4_values**2
+            elif i == 10:
+                c_n_coefficients[i] = 49.0 / 40.0 * c_n_coefficients[8] ** 2 / c_6
+            else:
+                c_n_coefficients[i] = (
+                    c_n_coefficients[i - 6]
+                    * (c_n_coefficients[i - 2] / c_n_coefficients[i - 4]) ** 3
+                )
+
+        # Set up attributes
+        self._coordinates = coordinates
+        self._elements = elements
+        self._radii = radii
+        self.c_n_coefficients = c_n_coefficients
+        self.coordination_numbers = coordination_numbers
 
-        # Set up the atoms objects
+    @property
+    def atoms(self) -> list[Atom]:
+        """Atoms with coordination numbers, built on demand."""
         atoms = []
-        for i, (element, coordinate, radius) in enumerate(
-            zip(elements, coordinates, radii), start=1
+        for i, (element, coordinate, radius, coordination_number) in enumerate(
+            zip(
+                self._elements,
+                self._coordinates,
+                self._radii,
+                self.coordination_numbers,
+            ),
+            start=1,
         ):
-            atom = Atom(element, coordinate, radius, i)
+            atom = Atom(int(element), coordinate, float(radius), i)
+            atom.coordination_number = float(coordination_number)
             atoms.append(atom)
-        self._atoms = atoms
 
-        # Calculate the coordination numbers according to Grimme's recipe.
-        k_1 = 16
-        k_2 = 4 / 3
-        k_3 = 4
-        for cn_atom in atoms:
-            # Get coordinates and radii of all other atoms
-            other_coordinates: Array2DFloat = np.array(
-                [atom.coordinates for atom in atoms if atom is not cn_atom]
-            )
-            other_radii: Array1DFloat = np.array(
-                [atom.radius for atom in atoms if atom is not cn_atom]
-            )
+        return atoms
 
-            # Calculate distances
-            dists = cdist(
-                np.array(cn_atom.coordinates).reshape(-1, 3),
-                other_coordinates.reshape(-1, 3),
-            )
+    @classmethod
+    def from_batch(
+        cls,
+        molecules: Iterable[tuple[Iterable[int] | Iterable[str], ArrayLike2D]],
+        n_processes: int | None = None,
+        **kwargs: Any,
+    ) -> list[D3Calculator]:
+        """Calculate multiple molecules in parallel processes.
 
-            # Calculate coordination number
-            coordination_number = np.sum(
-                1
-                / (
-                    1
-                    + np.exp(-k_1 * (k_2 * (cn_atom.radius + other_radii) / dists - 1))
-                )
-            )
-            cn_atom.coordination_number = coordination_number
+        Workers are spawned, so scripts must call this under
+        ``if __name__ == "__main__":``.
 
-        # Calculate the C_N coefficients
-        c_n_coefficients: dict[int, list[float]] = {
-            i: [] for i in range(6, order + 1, 2)
-        }
-        for atom in atoms:
-            # Get the reference data for atom
-            reference_data = c6_reference_data[atom.element]
-            cn = atom.coordination_number
-
-            # Take out the coordination numbers and c6(aa) values
-            c_6_ref = reference_data[:, 0]
-            cn_1 = reference_data[:, 1]
-            cn_2 = reference_data[:, 2]
-
-            # Calculate c6  and c8 according to the recipe
-            r = (cn - cn_1) ** 2 + (cn - cn_2) ** 2
-            L = np.exp(-k_3 * r)
-            W = np.sum(L)
-            Z = np.sum(c_6_ref * L)
-            c_6 = Z / W
-
-            temp_coefficients: dict[int, float] = {
-                i: np.nan for i in range(6, order + 1, 2)
-            }
-            for i in range(6, order + 1, 2):
-                if i == 6:
-                    temp_coefficients[i] = c_6
-                if i == 8:
-                    c_8 = 3 * c_6 * r2_r4[atom.element] ** 2
-                    temp_coefficients[i] = c_8
-                elif i == 10:
-                    c_10 = 49.0 / 40.0 * c_8**2 / c_6
-                    temp_coefficients[i] = c_10
-                elif i > 10:
-                    c_n = (
-                        temp_coefficients[i - 6]
-                        * (temp_coefficients[i - 2] / temp_coefficients[i - 4]) ** 3
-                    )
-                    temp_coefficients[i] = c_n
-            for key, value in temp_coefficients.items():
-                c_n_coefficients[key].append(value)
+        Args:
+            molecules: Pairs of elements and coordinates (Å)
+            n_processes: Number of processes. Defaults to the number of CPUs.
+            **kwargs: Keyword arguments passed on to each calculation
 
-        # Set up attributes
-        coordination_numbers: Array1DFloat = np.array(
-            [atom.coordination_number for atom in self._atoms]
-        )
-        c_n_coefficients: Array1DFloat = {
-            key: np.array(value) for key, value in c_n_coefficients.items()
-        }
-
-        self._atoms = atoms
-        self.c_n_coefficients = c_n_coefficients
-        self.coordination_numbers = coordination_numbers
+        Returns:
+            calculators: Calculator objects in the same order as molecules
+        """
+        return _compute_batch(cls, molecules, n_processes, **kwargs)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({len(self._atoms)!r} atoms)"
+        return f"{self.__class__.__name__}({len(self._elements)!r} atoms)"
 
 
 def extrapolate_c_n(c_6: float, i: int, j: int, n: int) -> float:
@@ -249,3 +288,174 @@ def extrapolate_c_n(c_6: float, i: int, j: int, n: int) -> float:
     else:
         raise ValueError("Only defined for even n >= 6.")
     return c_n
+
+
+def _compute_batch(
+    calculator: Callable[..., Any],
+    molecules: Iterable[tuple[Iterable[int] | Iterable[str], ArrayLike2D]],
+    n_processes: int | None = None,
+    **kwargs: Any,
+) -> list[Any]:
+    """Run calculator on molecules in a process pool.
+
+    Args:
+        calculator: Calculator class
+        molecules: Pairs of elements and coordinates (Å)
+        n_processes: Number of processes. Defaults to the number of CPUs.
+        **kwargs: Keyword arguments passed on to the calculator
+
+    Returns:
+        results: Calculator objects in the same order as molecules
+    """
+    molecules = list(molecules)
+    if len(molecules) == 0:
+        return []
+    elements, coordinates = zip(*molecules)
+    function = functools.partial(calculator, **kwargs)
+
+    # Spawn fresh workers as forking a process with running Numba threads can hang
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=n_processes, mp_context=mp_context
+    ) as executor:
+        results = list(executor.map(function, elements, coordinates))
+
+    return results
+
+
+def get_d3_coordination_numbers(
+    coordinates: ArrayLike2D, radii: ArrayLike1D
+) -> Array1DFloat:
+    """Calculates D3 coordination numbers.
+
+    Uses compiled kernels for large systems if Numba is installed.
+
+    Args:
+        coordinates: Coordinates (Å)
+        radii: Covalent radii (Å)
+
+    Returns:
+        coordination_numbers: Coordination numbers
+    """
+    coordinates: Array2DFloat = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    radii: Array1DFloat = np.asarray(radii, dtype=float)
+    if NUMBA_AVAILABLE and len(coordinates) >= D3_NUMBA_MIN_ATOMS:
+        return _d3_coordination_numbers_kernel(coordinates, radii, D3_K_1, D3_K_2)
+
+    dists = cdist(coordinates, coordinates)
+    radii_sums = radii[:, np.newaxis] + radii[np.newaxis, :]
+    with np.errstate(divide="ignore"):
+        cn_matrix = 1 / (1 + np.exp(-D3_K_1 * (D3_K_2 * radii_sums / dists - 1)))
+    np.fill_diagonal(cn_matrix, 0)
+    coordination_numbers: Array1DFloat = cn_matrix.sum(axis=1)
+
+    return coordination_numbers
+
+
+def get_d3_c6_coefficients(
+    elements: Iterable[int], coordination_numbers: ArrayLike1D
+) -> Array1DFloat:
+    """Calculates D3 C₆ᴬᴬ coefficients from coordination numbers.
+
+    Uses compiled kernels for large systems if Numba is installed.
+
+    Args:
+        elements: Elements as atomic numbers
+        coordination_numbers: Coordination numbers
+
+    Returns:
+        c_6: C₆ᴬᴬ coefficients (a.u.)
+
+    Raises:
+        ValueError: When there is no reference data for an element
+    """
+    elements: Array1DInt = np.asarray(elements, dtype=int)
+    coordination_numbers: Array1DFloat = np.asarray(coordination_numbers, dtype=float)
+    missing_elements = set(elements.tolist()).difference(c6_reference_data)
+    if len(missing_elements) > 0:
+        raise ValueError(
+            f"No D3 reference data for elements: {sorted(missing_elements)}"
+        )
+    if NUMBA_AVAILABLE and len(elements) >= D3_NUMBA_MIN_ATOMS:
+        return _d3_c6_kernel(
+            elements,
+            coordination_numbers,
+            D3_REFERENCE_OFFSETS,
+            D3_REFERENCE_DATA,
+            D3_K_3,
+        )
+
+    # Atoms of the same element share reference data and are treated together.
+    c_6: Array1DFloat = np.empty(len(elements))
+    for element in np.unique(elements):
+        indices = np.flatnonzero(elements == element)
+
+        # Take out the coordination numbers and c6(aa) values
+        c_6_ref, cn_1, cn_2 = c6_reference_data[element].T
+
+        # Calculate c6 according to the recipe
+        cn = coordination_numbers[indices, np.newaxis]
+        r = (cn - cn_1) ** 2 + (cn - cn_2) ** 2
+        L = np.exp(-D3_K_3 * r)
+        W = np.sum(L, axis=1)
+        Z = np.sum(c_6_ref * L, axis=1)
+        c_6[indices] = Z / W
+
+    return c_6
+
+
+def _d3_coordination_numbers_kernel(
+    coordinates: Array2DFloat, radii: Array1DFloat, k_1: float, k_2: float
+) -> Array1DFloat:
+    """Loop version of D3 coordination numbers to be compiled with Numba."""
+    n_atoms = coordinates.shape[0]
+    coordination_numbers = np.zeros(n_atoms)
+    for i in numba.prange(n_atoms):
+        coordination_number = 0.0
+        for j in range(n_atoms):
+            if i == j:
+                continue
+            dist = np.sqrt(
+                (coordinates[i, 0] - coordinates[j, 0]) ** 2
+                + (coordinates[i, 1] - coordinates[j, 1]) ** 2
+                + (coordinates[i, 2] - coordinates[j, 2]) ** 2
+            )
+            coordination_number += 1 / (
+                1 + np.exp(-k_1 * (k_2 * (radii[i] + radii[j]) / dist - 1))
+            )
+        coordination_numbers[i] = coordination_number
+
+    return coordination_numbers
+
+
+def _d3_c6_kernel(
+    elements: Array1DInt,
+    coordination_numbers: Array1DFloat,
+    reference_offsets: Array1DInt,
+    reference_data: Array2DFloat,
+    k_3: float,
+) -> Array1DFloat:
+    """Loop version of D3 C₆ᴬᴬ coefficients to be compiled with Numba."""
+    n_atoms = elements.shape[0]
+    c_6 = np.zeros(n_atoms)
+    for i in numba.prange(n_atoms):
+        cn = coordination_numbers[i]
+        W = 0.0
+        Z = 0.0
+        start = reference_offsets[elements[i]]
+        end = reference_offsets[elements[i] + 1]
+        for j in range(start, end):
+            r = (cn - reference_data[j, 1]) ** 2 + (cn - reference_data[j, 2]) ** 2
+            L = np.exp(-k_3 * r)
+            W += L
+            Z += reference_data[j, 0] * L
+        c_6[i] = Z / W
+
+    return c_6
+
+
+if NUMBA_AVAILABLE:
+    _d3_coordination_numbers_kernel = numba.njit(
+        parallel=True, fastmath=True, cache=True
+    )(_d3_coordination_numbers_kernel)
+    _d3_c6_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_d3_c6_kernel)
@@ -220,7 +220,7 @@ class Dispersion:
 
         # Generate grid and fill with values
         grid = pv.UniformGrid()
-        grid.dimensions = np.array(parser.X.shape)
+        grid.dimensions = np.array(parser.S.shape)
         grid.origin = (parser.min_x, parser.min_y, parser.min_z)
         grid.spacing = (parser.step_x, parser.step_y, parser.step_z)
         grid.point_data["values"] = parser.S.flatten(order="F")
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+from io import StringIO
 from os import PathLike
 from pathlib import Path
 import typing
 from typing import Any
 
 import numpy as np
+import scipy.sparse
 
 from morfeus.d3_data import r2_r4
 from morfeus.data import BOHR_TO_ANGSTROM, KCAL_TO_HARTREE
 from morfeus.typing import (
     Array1DAny,
+    Array1DBool,
     Array1DFloat,
     Array1DInt,
     Array1DStr,
@@ -93,9 +96,9 @@ class CubeParser:
         step_x: Step size in x direction (Å)
         step_y: Step size in y direction (Å)
         step_z: Step size in z direction (Å)
-        X: 3D array of x values (Å)
-        Y: 3D array of y values (Å)
-        Z: 3D array of z values (Å)
+        x: Grid values in the x direction (Å)
+        y: Grid values in the y direction (Å)
+        z: Grid values in the z direction (Å)
         S: 3D array of electron density scalars (electorns / Bohr^3)
         n_points_x: Number of points in the x direction
         n_points_y: Number of points in the y direction
@@ -108,24 +111,26 @@ class CubeParser:
     step_x: float
     step_y: float
     step_z: float
-    X: Array3DFloat
-    Y: Array3DFloat
-    Z: Array3DFloat
+    x: Array1DFloat
+    y: Array1DFloat
+    z: Array1DFloat
     S: Array3DFloat
     n_points_x: int
     n_points_y: int
     n_points_z: int
 
     def __init__(self, file: str | PathLike) -> None:
-        # Read the lines from the cube file
-        with open(file) as file:
-            lines = file.readlines()
-
-        # Skip first two lines which are comments
-        lines = lines[2:]
-
-        # Get the number of atoms
-        n_atoms = int(lines[0].strip().split()[0])
+        # Read the header lines from the cube file and keep the rest as raw bytes,
+        # which NumPy parses without decoding to a string first.
+        with open(file, "rb") as file:
+            # Skip first two lines which are comments
+            lines = [file.readline().decode() for _ in range(6)][2:]
+
+            # Get the number of atoms and skip the atom lines
+            n_atoms = int(lines[0].strip().split()[0])
+            for _ in range(n_atoms):
+                file.readline()
+            data = file.read()
 
         # Get the minimum values along the axes
         min_x = float(lines[0].strip().split()[1]) * BOHR_TO_ANGSTROM
@@ -146,23 +151,16 @@ class CubeParser:
         x = min_x + np.arange(0, n_points_x) * step_x
         y = min_y + np.arange(0, n_points_y) * step_y
         z = min_z + np.arange(0, n_points_z) * step_z
-        X, Y, Z = np.meshgrid(x, y, z, indexing="ij")
-
-        # Skips to data lines and read in data
-        lines = lines[(n_atoms + 4) :]
 
-        data = []
-        for line in lines:
-            line_data = [float(datum) for datum in line.strip().split()]
-            data.extend(line_data)
-
-        # Create array
-        S: Array2DFloat = np.array(data).reshape(X.shape)
+        # Parse the data in one go and create array
+        S: Array3DFloat = np.fromstring(data, sep=" ").reshape(
+            n_points_x, n_points_y, n_points_z
+        )
 
         # Set up attributes
-        self.X = X
-        self.Y = Y
-        self.Z = Z
+        self.x = x
+        self.y = y
+        self.z = z
         self.S = S
 
         self.min_x = min_x
@@ -177,6 +175,21 @@ class CubeParser:
         self.n_points_y = n_points_y
         self.n_points_z = n_points_z
 
+    @property
+    def X(self) -> Array3DFloat:
+        """3D array of x values (Å). Read-only view broadcast from x."""
+        return np.broadcast_to(self.x[:, np.newaxis, np.newaxis], self.S.shape)
+
+    @property
+    def Y(self) -> Array3DFloat:
+        """3D array of y values (Å). Read-only view broadcast from y."""
+        return np.broadcast_to(self.y[np.newaxis, :, np.newaxis], self.S.shape)
+
+    @property
+    def Z(self) -> Array3DFloat:
+        """3D array of z values (Å). Read-only view broadcast from z."""
+        return np.broadcast_to(self.z[np.newaxis, np.newaxis, :], self.S.shape)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.S.size!r} points)"
 
@@ -202,26 +215,19 @@ class D3Parser:
         with open(file, encoding="utf-8") as file:
             lines = file.readlines()
 
-        # Parse the file for the coefficients
-        c6_coefficients = []
-        c8_coefficients = []
-        read = False
-        for line in lines:
-            if read:
-                if not line.strip():
-                    read = False
-                    break
-                strip_line = line.strip().split()
-                c6 = float(strip_line[7])
-                c8 = float(strip_line[8])
-                c6_coefficients.append(c6)
-                c8_coefficients.append(c8)
-            if "C8(AA)" in line:
-                read = True
+        # Locate the coefficient block and parse it in one go
+        start = next(
+            (i + 1 for i, line in enumerate(lines) if "C8(AA)" in line), len(lines)
+        )
+        end = next((i for i in range(start, len(lines)) if not lines[i].strip()), None)
+        data: Array2DFloat = np.loadtxt(
+            lines[start:end], comments=None, usecols=(7, 8), ndmin=2
+        )
+        c6_coefficients, c8_coefficients = data.T
 
         # Set attributes
-        self.c6_coefficients = np.array(c6_coefficients)
-        self.c8_coefficients = np.array(c8_coefficients)
+        self.c6_coefficients = c6_coefficients
+        self.c8_coefficients = c8_coefficients
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}"
@@ -248,29 +254,20 @@ class D4Parser:
         with open(file, encoding="utf-8") as file:
             lines = file.readlines()
 
-        # Parse the file and extract the coefficients
-        c6_coefficients = []
-        elements = []
-        read = False
-        for line in lines:
-            if read:
-                if not line.strip():
-                    read = False
-                    break
-                strip_line = line.strip().split()
-                element = int(strip_line[1])
-                elements.append(element)
-                c6 = float(strip_line[5])
-                c6_coefficients.append(c6)
-            if "C6AA" in line:
-                read = True
-        c6_coefficients: Array1DFloat = np.array(c6_coefficients)
-        c8_coefficients: Array1DFloat = np.array(
-            [
-                3 * c6 * r2_r4[element] ** 2
-                for c6, element in zip(c6_coefficients, elements)
-            ]
+        # Locate the coefficient block and parse it in one go
+        start = next(
+            (i + 1 for i, line in enumerate(lines) if "C6AA" in line), len(lines)
         )
+        end = next((i for i in range(start, len(lines)) if not lines[i].strip()), None)
+        data: Array2DFloat = np.loadtxt(
+            lines[start:end], comments=None, usecols=(1, 5), ndmin=2
+        )
+        elements: Array1DInt = data[:, 0].astype(int)
+        c6_coefficients: Array1DFloat = data[:, 1]
+        r2_r4_values: Array1DFloat = np.array(
+            [r2_r4[element] for element in elements], dtype=float
+        )
+        c8_coefficients: Array1DFloat = 3 * c6_coefficients * r2_r4_values**2
 
         # Set up attributes
         self.c6_coefficients = c6_coefficients
@@ -304,59 +301,75 @@ class VertexParser:
         # Get the number of vertices
         n_vertices = int(lines[0].strip().split()[5])
 
-        # Parse the vertex positions and their connectivities
-        vertices = {}
-        vertex_map = {}
-        connectivities: dict[int, set[int]] = {
-            i: set() for i in range(1, n_vertices + 1)
-        }
-        vertex_counter = 1
-        included_vertex_counter = 1
-        for line in lines:
-            if "HETATM" in line:
-                if line[13] == "C":
-                    x = float(line[32:39])
-                    y = float(line[40:47])
-                    z = float(line[48:55])
-                    vertices[vertex_counter] = [x, y, z]
-                    vertex_map[vertex_counter] = included_vertex_counter
-                    included_vertex_counter += 1
-                vertex_counter += 1
-            if "CONECT" in line:
-                n_entries = int(len(line.strip()) / 6 - 1)
-                entries = []
-                for i in range(1, n_entries + 1):
-                    entry = int(line[i * 6 : i * 6 + 6])
-                    entries.append(entry)
-                connectivities[entries[0]].update(entries[1:])
-
-        # Establish faces based on connectivity
-        # https://stackoverflow.com/questions/1705824/finding-cycle-of-3-nodes-or-triangles-in-a-graph # noqa: B950
-        if any(connectivities.values()):
-            faces = []
-            visited = set()
-            for vertex_1 in connectivities:
-                temp_visited = set()
-                for vertex_2 in connectivities[vertex_1]:
-                    if vertex_2 in visited:
-                        continue
-                    for vertex_3 in connectivities[vertex_2]:
-                        if vertex_3 in visited or vertex_3 in temp_visited:
-                            continue
-                        if vertex_1 in connectivities[vertex_3]:
-                            triangle_vertices = [vertex_1, vertex_2, vertex_3]
-                            mapped_vertices = [
-                                vertex_map[vertex] - 1 for vertex in triangle_vertices
-                            ]
-                            faces.append(mapped_vertices)
-                    temp_visited.add(vertex_2)
-                visited.add(vertex_1)
-            self.faces = np.array(faces)
+        # Parse the vertex positions. Only vertices marked with C are on the surface.
+        vertex_lines = [line for line in lines if line.startswith("HETATM")]
+        is_surface: Array1DBool = np.array(
+            [line[13] == "C" for line in vertex_lines], dtype=bool
+        )
+        vertices: Array2DFloat = np.fromstring(
+            " ".join(
+                f"{line[32:39]} {line[40:47]} {line[48:55]}"
+                for line, surface in zip(vertex_lines, is_surface)
+                if surface
+            ),
+            sep=" ",
+        ).reshape(-1, 3)
+        vertex_map: Array1DInt = np.full(n_vertices + 1, -1)
+        vertex_map[1 : len(vertex_lines) + 1][is_surface] = np.arange(len(vertices))
+
+        # Parse the connectivities. Each line lists a vertex followed by its
+        # neighbors in fields of width 6.
+        conect_lines = [line.strip() for line in lines if line.startswith("CONECT")]
+        conect_lines = [line for line in conect_lines if len(line) >= 12]
+        n_entries: Array1DInt = np.array(
+            [len(line) // 6 - 1 for line in conect_lines], dtype=int
+        )
+        entries: Array1DInt = np.fromstring(
+            " ".join(
+                line[i : i + 6]
+                for line in conect_lines
+                for i in range(6, len(line) // 6 * 6, 6)
+            ),
+            dtype=int,
+            sep=" ",
+        )
+        starts = np.cumsum(n_entries) - n_entries
+        edges: Array2DInt = np.column_stack(
+            [np.repeat(entries[starts], n_entries - 1), np.delete(entries, starts)]
+        )
+
+        # Establish faces based on connectivity. For each edge 1-2 with 1 < 2, the
+        # neighbors 3 > 2 of vertex 2 that are also neighbors of vertex 1 form
+        # triangles.
+        if len(edges) > 0:
+            adjacency = scipy.sparse.csr_matrix(
+                (np.ones(len(edges), dtype=bool), (edges[:, 0], edges[:, 1])),
+                shape=(n_vertices + 1, n_vertices + 1),
+            )
+            adjacency = scipy.sparse.triu(adjacency + adjacency.T, k=1, format="csr")
+            adjacency.sort_indices()
+
+            # Expand each edge 1-2 with all neighbors 3 of vertex 2
+            vertex_1, vertex_2 = adjacency.nonzero()
+            n_neighbors = np.diff(adjacency.indptr)[vertex_2]
+            starts = np.repeat(adjacency.indptr[vertex_2], n_neighbors)
+            offsets = np.arange(len(starts)) - np.repeat(
+                np.cumsum(n_neighbors) - n_neighbors, n_neighbors
+            )
+            vertex_1 = np.repeat(vertex_1, n_neighbors)
+            vertex_2 = np.repeat(vertex_2, n_neighbors)
+            vertex_3 = adjacency.indices[starts + offsets]
+
+            # Keep the closed triangles and map them to the included vertices
+            is_triangle = np.asarray(adjacency[vertex_1, vertex_3]).ravel()
+            triangles = np.column_stack([vertex_1, vertex_2, vertex_3])[is_triangle]
+            faces: Array2DInt = vertex_map[triangles]
+            self.faces = faces[np.all(faces >= 0, axis=1)]
         else:
             self.faces = None
 
         # Set up attributes.
-        self.vertices = np.array(list(vertices.values()))
+        self.vertices = vertices
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({len(self.vertices)!r} points)"
@@ -378,20 +391,16 @@ def read_gjf(file: str | PathLike) -> tuple[Array1DAny, Array1DFloat]:
     xyz_lines = text.split("\n\n")[2].splitlines()[1:]
     xyz_lines = [line for line in xyz_lines if line.strip()]
 
-    # Loop over lines and store elements and coordinates
-    elements: list[int | str] = []
-    coordinates: list[list[float]] = []
-    for line in xyz_lines:
-        split_line = line.strip().split()
-        element = split_line[0]
-        if element.isdigit():
-            elements.append(int(element))
-        else:
-            elements.append(element)
-        atom_coordinates = [float(i) for i in split_line[1:]]
-        coordinates.append(atom_coordinates)
-    elements: Array1DInt | Array1DStr = np.array(elements)
-    coordinates: Array2DFloat = np.array(coordinates)
+    # Take elements from the first column and parse the coordinates in one go
+    elements: Array1DInt | Array1DStr = np.array(
+        [line.split()[0] for line in xyz_lines]
+    )
+    if np.all(np.char.isdigit(elements)):
+        elements = elements.astype(int)
+    n_columns = len(xyz_lines[0].split())
+    coordinates: Array2DFloat = np.loadtxt(
+        xyz_lines, comments=None, usecols=range(1, n_columns), ndmin=2
+    )
 
     return elements, coordinates
 
@@ -445,25 +454,25 @@ def read_xyz(
     with open(file) as f:
         lines = f.readlines()
 
-    # Loop over lines and store elements and coordinates
-    elements: list[int | str] = []
-    coordinates: list[list[float]] = []
+    # Take out the atom lines of each frame
     n_atoms = int(lines[0].strip())
-    line_chunks = zip(*[iter(lines)] * (n_atoms + 2))
-    for line_chunk in line_chunks:
-        for line in line_chunk[2:]:
-            strip_line = line.strip().split()
-            atom = strip_line[0]
-            if atom.isdigit():
-                atom = int(atom)
-            elements.append(atom)
-            coordinates.append(
-                [float(strip_line[1]), float(strip_line[2]), float(strip_line[3])]
-            )
-    elements = np.array(elements)[:n_atoms]
-    coordinates: Array2DFloat | Array3DFloat = np.array(coordinates).reshape(
-        -1, n_atoms, 3
+    n_frame_lines = n_atoms + 2
+    n_frames = len(lines) // n_frame_lines
+    atom_lines = [
+        line
+        for i in range(n_frames)
+        for line in lines[i * n_frame_lines + 2 : (i + 1) * n_frame_lines]
+    ]
+
+    # Take elements from the first frame and parse all coordinates in one go
+    elements: Array1DInt | Array1DStr = np.array(
+        [line.split()[0] for line in atom_lines[:n_atoms]]
     )
+    if np.all(np.char.isdigit(elements)):
+        elements = elements.astype(int)
+    coordinates: Array2DFloat | Array3DFloat = np.loadtxt(
+        atom_lines, comments=None, usecols=(1, 2, 3), ndmin=2
+    ).reshape(-1, n_atoms, 3)
     if coordinates.shape[0] == 1:
         coordinates = coordinates[0]
 
@@ -506,10 +515,9 @@ def get_xyz_string(
     Returns:
         string: XYZ string
     """
-    string = f"{len(symbols)}\n"
-    string += f"{comment}\n"
-    for s, c in zip(symbols, coordinates):
-        string += f"{s:10s}{c[0]:10.5f}{c[1]:10.5f}{c[2]:10.5f}\n"
+    with StringIO() as f:
+        _write_xyz_frame(f, symbols, coordinates, comment)
+        string = f.getvalue()
 
     return string
 
@@ -539,5 +547,30 @@ def write_xyz(
     # Write the xyz file
     with open(file, "w") as f:
         for coord, comment in zip(coordinates, comments):
-            xyz_string = get_xyz_string(symbols, coord, comment=comment)
-            f.write(xyz_string)
+            _write_xyz_frame(f, symbols, coord, comment)
+
+
+def _write_xyz_frame(
+    f: typing.TextIO,
+    symbols: Sequence[str],
+    coordinates: Sequence[Sequence[float]],
+    comment: str,
+) -> None:
+    """Writes a single xyz frame to an open file with one np.savetxt call.
+
+    Args:
+        f: File object opened for writing text
+        symbols: Atomic symbols
+        coordinates: Atomic coordinates (Å)
+        comment: Comment
+    """
+    table = np.empty((len(symbols), 4), dtype=object)
+    table[:, 0] = symbols
+    table[:, 1:] = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    np.savetxt(
+        f,
+        table,
+        fmt="%-10s%10.5f%10.5f%10.5f",
+        header=f"{len(symbols)}\n{comment}",
+        comments="",
+    )
@@ -6,7 +6,7 @@ import nox
 from nox.sessions import Session
 
 package = "morfeus"
-nox.options.sessions = "lint", "tests", "mypy"  # default session
+nox.options.sessions = "lint", "tests", "tests_numba", "mypy"  # default session
 locations = "morfeus", "tests", "noxfile.py"  # Linting locations
 pyversions = ["3.8", "3.9", "3.10"]
 
@@ -21,6 +21,15 @@ def tests(session: Session) -> None:
     session.run("pytest", *args)
 
 
+@nox.session(python="3.10")
+def tests_numba(session: Session) -> None:
+    """Run tests with the optional Numba kernels."""
+    args = session.posargs + ["--cov=morfeus", "--import-mode=importlib", "-s"]
+    session.install("pytest", "pytest-cov", "numba")
+    session.install(".")
+    session.run("pytest", *args)
+
+
 # Linting
 @nox.session(python="3.10")
 def lint(session: Session) -> None:
@@ -7,7 +7,19 @@ import numpy as np
 from numpy.testing import assert_almost_equal
 import pytest
 
-from morfeus import Dispersion
+from morfeus import Dispersion, read_xyz
+import morfeus.calculators
+from morfeus.calculators import (
+    D3_K_1,
+    D3_K_2,
+    D3_K_3,
+    D3_REFERENCE_DATA,
+    D3_REFERENCE_OFFSETS,
+    D3Calculator,
+    get_d3_c6_coefficients,
+    get_d3_coordination_numbers,
+)
+from morfeus.utils import convert_elements, get_radii
 
 DATA_DIR = Path(__file__).parent / "data" / "dispersion"
 
@@ -25,6 +37,87 @@ def test_H():
     assert_almost_equal(disp.p_int, 6.2, decimal=1)
 
 
+def test_d3_calculator():
+    """Test D3 coordination numbers and coefficients for water."""
+    elements = ["O", "H", "H"]
+    coordinates = [[0.0, 0.0, 0.1173], [0.0, 0.7572, -0.4692], [0.0, -0.7572, -0.4692]]
+    calc = D3Calculator(elements, coordinates)
+    assert_almost_equal(calc.coordination_numbers, [1.989, 0.995, 0.995], decimal=3)
+    assert_almost_equal(calc.c_n_coefficients[6], [10.41, 3.09, 3.09], decimal=2)
+    assert_almost_equal(calc.c_n_coefficients[8], [210.14, 37.39, 37.39], decimal=2)
+    assert [atom.element for atom in calc.atoms] == [8, 1, 1]
+    assert_almost_equal(calc.atoms[0].coordination_number, 1.989, decimal=3)
+
+
+def test_d3_kernels(monkeypatch):
+    """Test that the Numba kernels agree with the NumPy code."""
+    pytest.importorskip("numba")
+    path = Path(__file__).parent / "data" / "sasa" / "xyz" / "1.xyz"
+    elements, coordinates = read_xyz(path)
+    elements = np.array(convert_elements(elements, output="numbers"))
+    radii = np.array(get_radii(elements, radii_type="pyykko"))
+
+    # Reference from NumPy code
+    monkeypatch.setattr(morfeus.calculators, "NUMBA_AVAILABLE", False)
+    ref_cns = get_d3_coordination_numbers(coordinates, radii)
+    ref_c_6 = get_d3_c6_coefficients(elements, ref_cns)
+
+    # Call kernels directly
+    cns = morfeus.calculators._d3_coordination_numbers_kernel(
+        coordinates, radii, D3_K_1, D3_K_2
+    )
+    c_6 = morfeus.calculators._d3_c6_kernel(
+        elements, cns, D3_REFERENCE_OFFSETS, D3_REFERENCE_DATA, D3_K_3
+    )
+    assert_almost_equal(cns, ref_cns)
+    assert_almost_equal(c_6 / ref_c_6, 1)
+
+    # Use kernels through the calculator
+    monkeypatch.setattr(morfeus.calculators, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(morfeus.calculators, "D3_NUMBA_MIN_ATOMS", 0)
+    calc = D3Calculator(elements, coordinates)
+    assert_almost_equal(calc.coordination_numbers, ref_cns)
+    assert_almost_equal(calc.c_n_coefficients[6] / ref_c_6, 1)
+
+
+@pytest.mark.parametrize("min_atoms", [0, 1000])
+def test_d3_missing_element(monkeypatch, min_atoms):
+    """Test error for element without D3 reference data."""
+    monkeypatch.setattr(morfeus.calculators, "D3_NUMBA_MIN_ATOMS", min_atoms)
+    with pytest.raises(ValueError):
+        D3Calculator([95, 1], [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+
+
+def test_d3_calculator_batch():
+    """Test parallel D3 calculations on a batch of molecules."""
+    path = Path(__file__).parent / "data" / "sasa" / "xyz" / "1.xyz"
+    molecules = [read_xyz(path), (["H", "H"], [[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]])]
+    calcs = D3Calculator.from_batch(molecules, n_processes=2, order=10)
+    assert len(calcs) == 2
+    for calc, (elements, coordinates) in zip(calcs, molecules):
+        ref_calc = D3Calculator(elements, coordinates, order=10)
+        assert_almost_equal(calc.c_n_coefficients[10], ref_calc.c_n_coefficients[10])
+
+
+def test_d4_grimme_batch():
+    """Test parallel D4 calculations on a batch of molecules."""
+    pytest.importorskip("dftd4")
+    from morfeus.calculators import D4Grimme
+
+    molecules = [
+        (["H", "H"], [[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]]),
+        (
+            ["O", "H", "H"],
+            [[0.0, 0.0, 0.1173], [0.0, 0.7572, -0.4692], [0.0, -0.7572, -0.4692]],
+        ),
+    ]
+    calcs = D4Grimme.from_batch(molecules, n_processes=2)
+    assert len(calcs) == 2
+    for calc, (elements, coordinates) in zip(calcs, molecules):
+        ref_calc = D4Grimme(elements, coordinates)
+        assert_almost_equal(calc.c_n_coefficients[8], ref_calc.c_n_coefficients[8])
+
+
 def pytest_generate_tests(metafunc):
     """Generate test data from csv file."""
     if "disp_data" in metafunc.fixturenames:
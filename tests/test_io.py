@@ -0,0 +1,198 @@
+"""Test input and output."""
+
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from morfeus.d3_data import r2_r4
+from morfeus.data import BOHR_TO_ANGSTROM
+from morfeus.io import (
+    CubeParser,
+    D3Parser,
+    D4Parser,
+    get_xyz_string,
+    read_gjf,
+    read_xyz,
+    VertexParser,
+    write_xyz,
+)
+
+CUBE = """\
+Test cube file
+Electron density
+    1   -1.000000   -2.000000   -3.000000
+    2    0.200000    0.000000    0.000000
+    3    0.000000    0.300000    0.000000
+    4    0.000000    0.000000    0.400000
+    1    1.000000    0.000000    0.000000    0.000000
+  1.00000E-01  2.00000E-01  3.00000E-01  4.00000E-01
+  5.00000E-01  6.00000E-01  7.00000E-01  8.00000E-01
+  9.00000E-01  1.00000E+00  1.10000E+00  1.20000E+00
+  1.30000E+00  1.40000E+00  1.50000E+00  1.60000E+00
+  1.70000E+00  1.80000E+00  1.90000E+00  2.00000E+00
+  2.10000E+00  2.20000E+00  2.30000E+00  2.40000E+00
+"""
+
+XYZ = """\
+3
+Frame 1
+O     0.00000   0.00000   0.11730
+H     0.00000   0.75720  -0.46920
+H     0.00000  -0.75720  -0.46920
+3
+Frame 2
+O     0.00000   0.00000   0.21730
+H     0.00000   0.75720  -0.36920
+H     0.00000  -0.75720  -0.36920
+"""
+
+D3_OUTPUT = """\
+ molecular C6(AA) [au] =        45.54
+
+#               XYZ [au]               R0(AA) [Ang.]  CN       C6(AA)     C8(AA)   C10(AA) [au]
+  1    0.00000   0.00000   0.22166   o   1.342  1.9891    10.41      210.14      5207.76
+  2    0.00000   1.43090  -0.88666   h   0.910  0.9951     3.09       37.39       562.08
+  3    0.00000  -1.43090  -0.88666   h   0.910  0.9951     3.09       37.39       562.08
+
+ molecular C8(AA) [au] =       941.25
+"""
+
+D4_OUTPUT = """\
+   #   Z        covCN         q      C6AA      α(0)
+     1   8 o        1.6105   -0.5657    13.0417     6.4107
+     2   1 h        0.8052    0.2828     2.4587     1.8470
+     3   1 h        0.8052    0.2828     2.4587     1.8470
+
+molecular C6(AA) /au·bohr⁶  :         44.5413
+"""
+
+GJF = """\
+%chk=water.chk
+#p opt b3lyp/6-31g(d)
+
+Water
+
+0 1
+O     0.00000   0.00000   0.11730
+H     0.00000   0.75720  -0.46920
+H     0.00000  -0.75720  -0.46920
+
+"""
+
+VTX = """\
+REMARK   Generated by Multiwfn, totally          5 surface vertices
+HETATM    1  C   MOL A   1        0.000   0.000   0.000  1.00  0.00
+HETATM    2  O   MOL A   1       -1.500   0.000   0.000  1.00  0.00
+HETATM    3  C   MOL A   1        1.500   0.000   0.000  1.00  0.00
+HETATM    4  C   MOL A   1        0.000   1.500   0.000  1.00  0.00
+HETATM    5  C   MOL A   1        0.000   0.000   1.500  1.00  0.00
+CONECT     1     2     3     4     5
+CONECT     2     1     3
+CONECT     3     1     2     4     5
+CONECT     4     1     3     5
+CONECT     5     1     3     4
+"""
+
+
+def test_cube(tmp_path):
+    """Test parsing of cube file."""
+    path = tmp_path / "density.cube"
+    path.write_text(CUBE)
+    parser = CubeParser(path)
+    assert parser.S.shape == (2, 3, 4)
+    assert_almost_equal(parser.S.ravel(), np.arange(1, 25) * 0.1)
+    assert_almost_equal(parser.S[1, 2, 3], 2.4)
+    assert_almost_equal(parser.min_y, -2.0 * BOHR_TO_ANGSTROM)
+    assert_almost_equal(parser.step_z, 0.4 * BOHR_TO_ANGSTROM)
+    assert_almost_equal(parser.z, (-3.0 + np.arange(4) * 0.4) * BOHR_TO_ANGSTROM)
+    assert parser.X.shape == parser.S.shape
+    assert_almost_equal(parser.X[1, 2, 3], (-1.0 + 0.2) * BOHR_TO_ANGSTROM)
+    assert_almost_equal(parser.Y[1, 2, 3], (-2.0 + 0.6) * BOHR_TO_ANGSTROM)
+
+
+def test_xyz(tmp_path):
+    """Test parsing of single and multi-frame xyz files."""
+    path = tmp_path / "water.xyz"
+    path.write_text(XYZ)
+    elements, coordinates = read_xyz(path)
+    assert list(elements) == ["O", "H", "H"]
+    assert coordinates.shape == (2, 3, 3)
+    assert_almost_equal(coordinates[1, 0], [0.0, 0.0, 0.2173])
+
+    frame = "\n".join(XYZ.splitlines()[:5]) + "\n"
+    path.write_text(frame.replace("O ", "8 ").replace("H ", "1 "))
+    elements, coordinates = read_xyz(path)
+    assert list(elements) == [8, 1, 1]
+    assert coordinates.shape == (3, 3)
+    assert_almost_equal(coordinates[2], [0.0, -0.7572, -0.4692])
+
+
+def test_gjf(tmp_path):
+    """Test parsing of Gaussian input file."""
+    path = tmp_path / "water.gjf"
+    path.write_text(GJF)
+    elements, coordinates = read_gjf(path)
+    assert list(elements) == ["O", "H", "H"]
+    assert_almost_equal(coordinates[1], [0.0, 0.7572, -0.4692])
+
+    path.write_text(GJF.replace("O ", "8 ").replace("H ", "1 "))
+    elements, coordinates = read_gjf(path)
+    assert list(elements) == [8, 1, 1]
+    assert coordinates.shape == (3, 3)
+
+
+def test_write_xyz(tmp_path):
+    """Test round trip of writing and reading xyz files."""
+    path = tmp_path / "water.xyz"
+    path.write_text(XYZ)
+    elements, coordinates = read_xyz(path)
+    comments = ["Frame 1", "Frame 2"]
+    write_xyz(path, elements, coordinates, comments=comments)
+    assert path.read_text().splitlines()[:3] == [
+        "3",
+        "Frame 1",
+        "O            0.00000   0.00000   0.11730",
+    ]
+    elements_new, coordinates_new = read_xyz(path)
+    assert list(elements_new) == list(elements)
+    assert_almost_equal(coordinates_new, coordinates)
+
+    string = get_xyz_string(["H"], [[0.0, -0.7572, -0.3692]], comment="H atom")
+    assert string == "1\nH atom\nH            0.00000  -0.75720  -0.36920\n"
+
+
+def test_vertices(tmp_path):
+    """Test parsing of Multiwfn vertex file."""
+    path = tmp_path / "vtx.pdb"
+    path.write_text(VTX)
+    parser = VertexParser(path)
+    assert parser.vertices.shape == (4, 3)
+    assert_almost_equal(parser.vertices[1], [1.5, 0.0, 0.0])
+    assert_almost_equal(parser.vertices[3], [0.0, 0.0, 1.5])
+    # Face 1-2-3 through the non-surface vertex 2 is dropped
+    faces = sorted(tuple(sorted(face)) for face in parser.faces.tolist())
+    assert faces == [(0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3)]
+
+
+def test_d3_output(tmp_path):
+    """Test parsing of D3 program output."""
+    path = tmp_path / "d3.out"
+    path.write_text(D3_OUTPUT)
+    parser = D3Parser(path)
+    assert_almost_equal(parser.c6_coefficients, [10.41, 3.09, 3.09])
+    assert_almost_equal(parser.c8_coefficients, [210.14, 37.39, 37.39])
+
+
+def test_d4_output(tmp_path):
+    """Test parsing of D4 program output."""
+    path = tmp_path / "d4.out"
+    path.write_text(D4_OUTPUT, encoding="utf-8")
+    parser = D4Parser(path)
+    assert_almost_equal(parser.c6_coefficients, [13.0417, 2.4587, 2.4587])
+    assert_almost_equal(
+        parser.c8_coefficients,
+        [
+            3 * 13.0417 * r2_r4[8] ** 2,
+            3 * 2.4587 * r2_r4[1] ** 2,
+            3 * 2.4587 * r2_r4[1] ** 2,
+        ],
+    )